@@ -0,0 +1,10 @@
+SELECT c.coll_id, c.coll_name
+FROM r_coll_main c
+WHERE c.coll_id > CAST(? AS BIGINT)
+	AND c.coll_type != 'linkPoint'
+	AND NOT EXISTS (
+		SELECT 1
+		FROM r_objt_metamap om JOIN r_meta_main m ON m.meta_id = om.meta_id
+		WHERE om.object_id = c.coll_id AND m.meta_attr_name = 'ipc_UUID')
+ORDER BY c.coll_id ASC
+LIMIT ?
\ No newline at end of file
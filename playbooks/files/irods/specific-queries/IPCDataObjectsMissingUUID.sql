@@ -0,0 +1,9 @@
+SELECT DISTINCT d.data_id, c.coll_name || '/' || d.data_name
+FROM r_data_main d JOIN r_coll_main c ON c.coll_id = d.coll_id
+WHERE d.data_id > CAST(? AS BIGINT)
+	AND NOT EXISTS (
+		SELECT 1
+		FROM r_objt_metamap om JOIN r_meta_main m ON m.meta_id = om.meta_id
+		WHERE om.object_id = d.data_id AND m.meta_attr_name = 'ipc_UUID')
+ORDER BY d.data_id ASC
+LIMIT ?
\ No newline at end of file
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+"""Durable on-disk spool for AMQP messages
+
+A spool holds AMQP messages that couldn't be published, so that they can be
+published later in the order they were spooled. It is a directory of
+append-only segment files. Each segment holds one message per line, encoded as
+a JSON object with the fields `exchange`, `key`, and `body`. Segments are named
+by a zero-padded sequence number, so that lexical order is spooling order. When
+the newest segment reaches the segment size, a new segment is started.
+
+Appending is serialized across processes through an advisory lock on the file
+`lock`, and each append is flushed to disk with a single fsync, no matter how
+many messages it holds. Only one process may read from a spool. The reader
+records how far it has gotten in the file `cursor`, and segments that have been
+read completely are removed when the reader commits its position.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+import fcntl
+import json
+import os
+from typing import Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+
+DEFAULT_DIRECTORY = '/var/lib/irods/amqp-spool'
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024
+
+_CURSOR_FILE = 'cursor'
+_LOCK_FILE = 'lock'
+_SEGMENT_SUFFIX = '.seg'
+
+# the number of bytes read from a segment at a time
+_READ_SIZE = 64 * 1024
+
+
+class SpoolFull(Exception):
+    """Raised when appending messages would grow the spool beyond its maximum size"""
+
+
+class Message(NamedTuple):
+    """An AMQP message"""
+    exchange: str
+    key: str
+    body: str
+
+
+class Position(NamedTuple):
+    """A location in a spool, the byte offset into a given segment"""
+    segment: int
+    offset: int
+
+
+class Spool:
+    """A durable, segmented, append-only queue of AMQP messages
+
+    Args:
+        directory: the directory holding the spool, it is created if it doesn't exist
+        max_size: the maximum number of bytes the spool's segments may occupy
+        segment_size: the number of bytes after which a new segment is started
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_DIRECTORY,
+        max_size: int = DEFAULT_MAX_SIZE,
+        segment_size: int = DEFAULT_SEGMENT_SIZE
+    ):
+        self._dir = directory
+        self._max_size = max_size
+        self._segment_size = segment_size
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def append(self, messages: Iterable[Message]) -> None:
+        """Durably appends messages to the spool
+
+        Raises:
+            SpoolFull: the messages would make the spool exceed its maximum size. No messages
+                are appended in this case.
+            OSError: the messages couldn't be written
+        """
+        data = b''.join(_encode(m) for m in messages)
+
+        if not data:
+            return
+
+        with self._lock():
+            segments = self._segments()
+
+            if sum(self._segment_sizes(segments)) + len(data) > self._max_size:
+                raise SpoolFull(f"spool {self._dir} has reached its maximum size")
+
+            segment = segments[-1] if segments else self._cursor().segment
+            size = self._size(segment) if segments else 0
+
+            if segments and size >= self._segment_size:
+                segment += 1
+                size = 0
+
+            fd = os.open(self._segment_path(segment), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+
+            try:
+                # A torn write, left by a crash, is terminated so that it doesn't corrupt the
+                # first message of this append.
+                if size > 0 and os.pread(fd, 1, size - 1) != b'\n':
+                    data = b'\n' + data
+
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def pending(self) -> bool:
+        """Indicates whether or not the spool holds messages that haven't been read"""
+        segments = self._segments()
+
+        if not segments:
+            return False
+
+        cursor = self._cursor()
+
+        if cursor.segment < segments[-1]:
+            return True
+
+        return cursor.segment == segments[-1] and cursor.offset < self._size(segments[-1])
+
+    def read(self, limit: int) -> Tuple[List[Tuple[Message, Position]], Position]:
+        """Reads the next unread messages in spool order
+
+        This doesn't advance the reader, see commit.
+
+        Args:
+            limit: the maximum number of messages to read
+
+        Returns:
+            A list of the messages read, each paired with the position immediately following
+            it, and the position where reading stopped. The latter may be beyond the position
+            of the last message read, when unreadable data was skipped.
+        """
+        records: List[Tuple[Message, Position]] = []
+        segments = [s for s in self._segments() if s >= self._cursor().segment]
+        position = self._cursor()
+
+        for segment in segments:
+            if segment != position.segment:
+                position = Position(segment, 0)
+
+            position = self._read_segment(position, limit - len(records), records)
+
+            # Only the newest segment can still be written to, so anything left unread in an
+            # older one is a torn write and is skipped.
+            if len(records) >= limit or segment == segments[-1]:
+                break
+
+        return records, position
+
+    def commit(self, position: Position) -> None:
+        """Advances the reader to the given position, removing segments that have been read"""
+        tmp_path = os.path.join(self._dir, _CURSOR_FILE + '.tmp')
+
+        with self._lock():
+            segments = self._segments()
+
+            # A completely read newest segment is retired too, so that it no longer counts
+            # against the spool's size.
+            if (
+                segments
+                and position.segment == segments[-1]
+                and position.offset >= self._size(position.segment)
+            ):
+                position = Position(position.segment + 1, 0)
+
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(f"{position.segment} {position.offset}\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp_path, os.path.join(self._dir, _CURSOR_FILE))
+
+            for segment in segments:
+                if segment < position.segment:
+                    os.unlink(self._segment_path(segment))
+
+    def stats(self) -> Mapping[str, int]:
+        """Reports the number of segments, bytes held, and bytes not yet read"""
+        segments = self._segments()
+        sizes = self._segment_sizes(segments)
+        cursor = self._cursor()
+        unread = 0
+
+        for segment, size in zip(segments, sizes):
+            if segment > cursor.segment:
+                unread += size
+            elif segment == cursor.segment:
+                unread += max(0, size - cursor.offset)
+
+        return {'segments': len(segments), 'size': sum(sizes), 'unread': unread}
+
+    def _cursor(self) -> Position:
+        try:
+            with open(os.path.join(self._dir, _CURSOR_FILE), encoding='utf-8') as f:
+                segment, offset = f.read().split()
+                return Position(int(segment), int(offset))
+        except FileNotFoundError:
+            return Position(0, 0)
+
+    def _lock(self) -> '_Lock':
+        return _Lock(os.path.join(self._dir, _LOCK_FILE))
+
+    def _read_segment(
+        self, start: Position, limit: int, records: List[Tuple[Message, Position]]
+    ) -> Position:
+        offset = start.offset
+
+        try:
+            f = open(self._segment_path(start.segment), 'rb')  # pylint: disable=consider-using-with
+        except FileNotFoundError:
+            return start
+
+        with f:
+            f.seek(offset)
+            buf = b''
+
+            while limit > 0:
+                chunk = f.read(_READ_SIZE)
+
+                if not chunk:
+                    break
+
+                buf += chunk
+                lines = buf.split(b'\n')
+                buf = lines.pop()
+
+                for line in lines:
+                    offset += len(line) + 1
+                    msg = _decode(line)
+
+                    if msg is not None:
+                        records.append((msg, Position(start.segment, offset)))
+                        limit -= 1
+
+                        if limit == 0:
+                            break
+
+        return Position(start.segment, offset)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._dir, f"{segment:020d}{_SEGMENT_SUFFIX}")
+
+    def _segment_sizes(self, segments: List[int]) -> List[int]:
+        return [self._size(s) for s in segments]
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(n[:-len(_SEGMENT_SUFFIX)])
+            for n in os.listdir(self._dir) if n.endswith(_SEGMENT_SUFFIX))
+
+    def _size(self, segment: int) -> int:
+        try:
+            return os.stat(self._segment_path(segment)).st_size
+        except FileNotFoundError:
+            return 0
+
+
+class _Lock:
+
+    def __init__(self, path: str):
+        self._path = path
+        self._fd = -1
+
+    def __enter__(self) -> '_Lock':
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *_) -> None:
+        os.close(self._fd)
+
+
+def _decode(line: bytes) -> Optional[Message]:
+    try:
+        fields = json.loads(line)
+        return Message(exchange=fields['exchange'], key=fields['key'], body=fields['body'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _encode(msg: Message) -> bytes:
+    fields = {'exchange': msg.exchange, 'key': msg.key, 'body': msg.body}
+    return json.dumps(fields).encode('utf-8') + b'\n'
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""A long-lived psql session with the ICAT DB
+
+The Data Store services send their statements to the ICAT DB through a single
+psql process instead of starting one per statement. After each statement, the
+session has psql echo a marker along with the value of its ERROR variable, so
+that it can tell where the statement's output ends and whether it succeeded.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+import logging
+import os
+import selectors
+import subprocess
+import threading
+import time
+from typing import Dict, IO, List, Mapping, Optional, Tuple
+
+
+# the number of seconds to wait for psql to report the outcome of a statement
+DEFAULT_TIMEOUT = 60
+
+# the separator psql places between the fields of a row
+_FIELD_SEPARATOR = '\x1f'
+
+_LOG = logging.getLogger(__name__)
+
+
+class DBError(Exception):
+    """The DB didn't accept a statement, or psql couldn't be reached"""
+
+
+def read_config(path: str) -> Dict[str, str]:
+    """Reads the settings from a service configuration file
+
+    Each setting is on its own line as NAME=VALUE. Blank lines and comment lines are ignored.
+
+    Args:
+        path: the path to the configuration file
+
+    Raises:
+        OSError: the file couldn't be read
+    """
+    settings = {}
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+
+            if line and not line.startswith('#') and '=' in line:
+                name, value = line.split('=', 1)
+                settings[name.strip()] = value.strip()
+
+    return settings
+
+
+def psql_env(environ: Mapping[str, str]) -> Dict[str, str]:
+    """Builds the environment psql connects to the ICAT DB with
+
+    Args:
+        environ: an environment providing IRODS_DB_HOST, IRODS_DB_PORT, IRODS_DB_USERNAME, and
+            IRODS_DB_PASSWORD
+
+    Raises:
+        KeyError: one of the connection settings is missing
+    """
+    env = dict(environ)
+    env['PGHOST'] = environ['IRODS_DB_HOST']
+    env['PGPORT'] = environ['IRODS_DB_PORT']
+    env['PGUSER'] = environ['IRODS_DB_USERNAME']
+    env['PGPASSWORD'] = environ['IRODS_DB_PASSWORD']
+    return env
+
+
+class ICATSession:
+    """Runs statements through a long-lived psql process
+
+    It is safe to share a session between threads. psql is started when the first statement is
+    run, and restarted after it is lost.
+    """
+
+    def __init__(self, env: Mapping[str, str], timeout: float = DEFAULT_TIMEOUT):
+        self._env = env
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._selector = selectors.DefaultSelector()
+        self._buf = b''
+        self._seq = 0
+
+    def execute(self, statement: str) -> List[List[str]]:
+        """Runs one or more statements
+
+        Args:
+            statement: the SQL to run, terminated by a semicolon
+
+        Returns:
+            the rows output by the statement, each as a list of field values
+
+        Raises:
+            DBError: the DB rejected the statement, or psql was lost
+        """
+        with self._lock:
+            self._seq += 1
+            marker = f"done-{self._seq}"
+
+            try:
+                proc = self._start()
+                proc.stdin.write(  # type: ignore[union-attr]
+                    f"{statement}\n\\echo {marker} :ERROR\n".encode('utf-8'))
+                proc.stdin.flush()  # type: ignore[union-attr]
+                failed, rows = self._await(marker)
+            except (OSError, DBError) as e:
+                self._stop()
+                raise DBError(f"lost psql: {e}") from e
+
+        if failed:
+            raise DBError('the DB rejected the statement')
+
+        return rows
+
+    def close(self) -> None:
+        """Stops psql"""
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> subprocess.Popen:
+        if self._proc is None:
+            self._proc = subprocess.Popen(  # pylint: disable=consider-using-with
+                [
+                    'psql', '--no-psqlrc', '--quiet', '--no-align', '--tuples-only',
+                    f"--field-separator={_FIELD_SEPARATOR}", 'ICAT'
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=self._env)
+
+            threading.Thread(target=_log_stderr, args=(self._proc.stderr,), daemon=True).start()
+            self._selector.register(self._proc.stdout, selectors.EVENT_READ)
+
+        return self._proc
+
+    def _stop(self) -> None:
+        if self._proc:
+            self._selector.unregister(self._proc.stdout)
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+            self._buf = b''
+
+    def _await(self, marker: str) -> Tuple[bool, List[List[str]]]:
+        deadline = time.monotonic() + self._timeout
+        fd = self._proc.stdout.fileno()  # type: ignore[union-attr]
+        rows = []
+
+        while True:
+            while b'\n' in self._buf:
+                raw, self._buf = self._buf.split(b'\n', 1)
+                line = raw.decode('utf-8', errors='replace')
+                fields = line.split()
+
+                if len(fields) == 2 and fields[0] == marker:
+                    return fields[1] == 'true', rows
+
+                if line:
+                    rows.append(line.split(_FIELD_SEPARATOR))
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise DBError('timed out waiting for psql')
+
+            data = os.read(fd, 4096)
+
+            if not data:
+                raise DBError('psql exited')
+
+            self._buf += data
+
+
+def _log_stderr(stream: IO[bytes]) -> None:
+    for line in stream:
+        _LOG.warning('psql: %s', line.decode('utf-8', errors='replace').rstrip())
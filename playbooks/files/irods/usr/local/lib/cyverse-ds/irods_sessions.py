@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""The python-irodsclient sessions shared by the Data Store services and tools
+
+The sessions authenticate as the service account, using its iRODS environment
+file and its obfuscated password file. A service either shares a bounded pool
+of sessions between the threads serving its requests, or gives each of its
+worker threads a session of its own.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+import os
+import threading
+from typing import Callable, List, Mapping, TypeVar
+
+from irods.exception import NetworkException
+from irods.session import iRODSSession
+
+
+# the number of seconds a session's connection is used before it is replaced, so that the server
+# doesn't drop it for being idle
+CONNECTION_REFRESH_TIME = 300
+
+_T = TypeVar('_T')
+
+
+def environment_file(environ: Mapping[str, str]) -> str:
+    """Returns the iRODS environment file named by IRODS_ENVIRONMENT_FILE or the default one"""
+    return environ.get(
+        'IRODS_ENVIRONMENT_FILE', os.path.expanduser('~/.irods/irods_environment.json'))
+
+
+def open_session(env_file: str) -> iRODSSession:
+    """Opens a session configured by the given iRODS environment file"""
+    return iRODSSession(irods_env_file=env_file, refresh_time=CONNECTION_REFRESH_TIME)
+
+
+class SessionPool:
+    """A bounded pool of iRODS sessions, opened as they are needed"""
+
+    def __init__(self, env_file: str, size: int):
+        self._env_file = env_file
+        self._size = size
+        self._idle: List[iRODSSession] = []
+        self._open = 0
+        self._cond = threading.Condition()
+
+    def run(self, operation: Callable[[iRODSSession], _T]) -> _T:
+        """Performs an operation with a session from the pool
+
+        A session whose connection fails is discarded instead of being returned to the pool.
+        """
+        session = self._acquire()
+
+        try:
+            result = operation(session)
+        except NetworkException:
+            self._discard(session)
+            raise
+
+        self._release(session)
+        return result
+
+    def close(self) -> None:
+        """Closes the idle sessions"""
+        with self._cond:
+            for session in self._idle:
+                session.cleanup()
+
+            self._open -= len(self._idle)
+            self._idle.clear()
+
+    def _acquire(self) -> iRODSSession:
+        with self._cond:
+            while not self._idle and self._open >= self._size:
+                self._cond.wait()
+
+            if self._idle:
+                return self._idle.pop()
+
+            self._open += 1
+
+        try:
+            return open_session(self._env_file)
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+
+            raise
+
+    def _discard(self, session: iRODSSession) -> None:
+        _cleanup(session)
+
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    def _release(self, session: iRODSSession) -> None:
+        with self._cond:
+            self._idle.append(session)
+            self._cond.notify()
+
+
+class ThreadSessions:
+    """Provides each thread with its own iRODS session, opened when it is first needed"""
+
+    def __init__(self, env_file: str):
+        self._env_file = env_file
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[iRODSSession] = []
+
+    def get(self) -> iRODSSession:
+        """Returns the calling thread's session, opening it if needed"""
+        session = getattr(self._local, 'session', None)
+
+        if session is None:
+            session = open_session(self._env_file)
+            self._local.session = session
+
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    def discard(self) -> None:
+        """Closes the calling thread's session after its connection failed"""
+        session = getattr(self._local, 'session', None)
+
+        if session is not None:
+            self._local.session = None
+
+            with self._lock:
+                self._sessions.remove(session)
+
+            _cleanup(session)
+
+    def close(self) -> None:
+        """Closes every thread's session"""
+        with self._lock:
+            for session in self._sessions:
+                _cleanup(session)
+
+            self._sessions.clear()
+
+
+def _cleanup(session: iRODSSession) -> None:
+    try:
+        session.cleanup()
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+"""SQL for the replication queue in the ICAT DB
+
+The table r_replication_queue holds at most one pending replication operation
+per data object. An operation is one of these.
+    repl  replicate the data object to dest_resc
+    mv    replicate the data object to dest_resc and dest_repl_resc, then trim
+          its other replicas
+    sync  bring the data object's stale replicas up to date
+
+When an operation is queued for a data object that already has one, the more
+thorough of the two is kept, `mv` being more thorough than `repl`, which is
+more thorough than `sync`. Either way, the entry's revision is incremented, so
+that a worker that claimed the earlier revision knows to redo the operation.
+
+A worker claims entries by pushing their attempt_ts into the future by a
+lease. If the worker doesn't report back before the lease expires, the entries
+become claimable again.
+
+Due entries are claimed shortest job first within a fairness bound. Each entry
+has a priority_ts, which is its attempt_ts pushed back by one second for every
+SIZE_PENALTY_RATE bytes in the data object, but by no more than
+MAX_SIZE_PENALTY seconds. Due entries are claimed in priority_ts order, so
+small data objects don't wait behind large ones, and a large data object waits
+at most MAX_SIZE_PENALTY seconds longer than it would in first come first
+served order.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+import re
+from typing import Iterable, NamedTuple, Sequence
+
+
+OPERATIONS = ('sync', 'repl', 'mv')
+
+# the number of seconds a claim lasts
+CLAIM_LEASE = 3600
+
+# the number of bytes in a data object that push its entry's priority back by one second
+SIZE_PENALTY_RATE = 2 ** 20
+
+# the maximum number of seconds an entry's priority is pushed back
+MAX_SIZE_PENALTY = 3600
+
+RESOURCE_PATTERN = re.compile(r'^[\w.-]*$')
+
+_RANK = "CASE {op} WHEN 'mv' THEN 3 WHEN 'repl' THEN 2 ELSE 1 END"
+
+_UPGRADE = f"{_RANK.format(op='EXCLUDED.operation')} > {_RANK.format(op='q.operation')}"
+
+_ENQUEUE_PREFIX = """
+INSERT INTO r_replication_queue AS q(
+	data_id, operation, dest_resc, dest_repl_resc, data_size, attempt_ts, priority_ts )
+SELECT
+	v.data_id, v.operation, v.dest_resc, v.dest_repl_resc, COALESCE(s.data_size, 0), v.attempt_ts,
+	"""
+
+
+def _priority(attempt_ts: str, data_size: str) -> str:
+    return (
+        f"{attempt_ts} + make_interval(secs => "
+        f"LEAST({data_size} / {SIZE_PENALTY_RATE}, {MAX_SIZE_PENALTY}))")
+
+
+_ENQUEUE_SUFFIX = f"""
+ON CONFLICT (data_id) DO UPDATE
+	SET
+		operation = CASE WHEN {_UPGRADE} THEN EXCLUDED.operation ELSE q.operation END,
+		dest_resc = CASE WHEN {_UPGRADE} THEN EXCLUDED.dest_resc ELSE q.dest_resc END,
+		dest_repl_resc = CASE WHEN {_UPGRADE} THEN EXCLUDED.dest_repl_resc ELSE q.dest_repl_resc END,
+		data_size = EXCLUDED.data_size,
+		priority_ts = {_priority('q.attempt_ts', 'EXCLUDED.data_size')},
+		revision = q.revision + 1,
+		attempts = 0;
+"""
+
+STATS = """
+SELECT
+	dest_resc,
+	COUNT(*),
+	COALESCE(CAST(EXTRACT(EPOCH FROM now() - MIN(queue_ts)) AS BIGINT), 0),
+	COUNT(*) FILTER (WHERE attempts > 0)
+FROM r_replication_queue
+GROUP BY dest_resc
+ORDER BY dest_resc;
+"""
+
+
+class Entry(NamedTuple):
+    """A queued replication operation"""
+
+    data_id: int
+    operation: str
+    dest_resc: str = ''
+    dest_repl_resc: str = ''
+    revision: int = 0
+
+
+def validate(entry: Entry) -> None:
+    """Checks that an entry can be safely embedded in SQL
+
+    Raises:
+        ValueError: the entry is invalid
+    """
+    if entry.operation not in OPERATIONS:
+        raise ValueError(f"unknown operation {entry.operation}")
+
+    for resc in (entry.dest_resc, entry.dest_repl_resc):
+        if not RESOURCE_PATTERN.match(resc):
+            raise ValueError(f"invalid resource name {resc}")
+
+
+def enqueue(entries: Iterable[Entry], delay: int = 0) -> str:
+    """Generates a single statement queuing operations
+
+    The size of each data object is looked up, so that its entry can be prioritized. The rows
+    are generated in data object order, so that concurrent statements lock rows in the same order
+    and can't deadlock.
+
+    Args:
+        entries: the operations to queue. They must already have been validated, and no data
+            object may appear more than once.
+        delay: the number of seconds to wait before attempting the operations
+    """
+    rows = [
+        f"(CAST({e.data_id} AS BIGINT), '{e.operation}', '{e.dest_resc}', '{e.dest_repl_resc}', "
+        f"now() + make_interval(secs => {int(delay)}))"
+        for e in sorted(entries)]
+
+    return (
+        _ENQUEUE_PREFIX
+        + _priority('v.attempt_ts', 'COALESCE(s.data_size, 0)')
+        + f"""
+FROM (VALUES {', '.join(rows)}) AS v(data_id, operation, dest_resc, dest_repl_resc, attempt_ts)
+	LEFT JOIN LATERAL (
+		SELECT MAX(d.data_size) AS data_size FROM r_data_main AS d WHERE d.data_id = v.data_id
+	) AS s ON TRUE
+ORDER BY v.data_id"""
+        + _ENQUEUE_SUFFIX)
+
+
+def claim(limit: int, skip_rescs: Sequence[str] = ()) -> str:
+    """Generates a statement claiming the entries that are due, in priority order
+
+    It outputs the data_id, operation, dest_resc, dest_repl_resc, and revision of each claimed
+    entry.
+
+    Args:
+        limit: the maximum number of entries to claim
+        skip_rescs: the destination resources whose entries shouldn't be claimed. The names must
+            already have been validated.
+    """
+    skip = ''
+
+    if skip_rescs:
+        quoted = ', '.join("'" + r + "'" for r in skip_rescs)
+        skip = f" AND dest_resc NOT IN ({quoted})"
+
+    lease_end = f"now() + make_interval(secs => {CLAIM_LEASE})"
+
+    return f"""
+WITH due AS (
+	SELECT data_id FROM r_replication_queue
+	WHERE attempt_ts <= now(){skip}
+	ORDER BY priority_ts
+	LIMIT {int(limit)}
+	FOR UPDATE SKIP LOCKED )
+UPDATE r_replication_queue AS q
+	SET
+		attempt_ts = {lease_end},
+		priority_ts = {_priority(lease_end, 'q.data_size')},
+		attempts = q.attempts + 1
+	FROM due
+	WHERE q.data_id = due.data_id
+	RETURNING q.data_id, q.operation, q.dest_resc, q.dest_repl_resc, q.revision;
+"""
+
+
+def complete(entries: Iterable[Entry]) -> str:
+    """Generates a single statement removing the entries whose operations were performed
+
+    An entry that was queued again since it was claimed is made due immediately instead of being
+    removed.
+    """
+    done = ', '.join(
+        f"(CAST({e.data_id} AS BIGINT), CAST({e.revision} AS BIGINT))" for e in sorted(entries))
+
+    return f"""
+WITH
+	done(data_id, revision) AS (VALUES {done}),
+	removed AS (
+		DELETE FROM r_replication_queue AS q USING done
+		WHERE q.data_id = done.data_id AND q.revision = done.revision )
+UPDATE r_replication_queue AS q
+	SET attempt_ts = now(), priority_ts = {_priority('now()', 'q.data_size')}, attempts = 0
+	FROM done
+	WHERE q.data_id = done.data_id AND q.revision <> done.revision;
+"""
+
+
+def retry(entries: Iterable[Entry], delay: int, error: str) -> str:
+    """Generates a single statement postponing the entries whose operations failed
+
+    Args:
+        entries: the entries to postpone
+        delay: the number of seconds to wait before attempting the operations again
+        error: the reason the operations failed
+    """
+    ids = ', '.join(str(e.data_id) for e in sorted(entries))
+    quoted_error = "'" + error.replace("'", "''") + "'"
+
+    retry_ts = f"now() + make_interval(secs => {int(delay)})"
+
+    return f"""
+UPDATE r_replication_queue
+	SET
+		attempt_ts = {retry_ts},
+		priority_ts = {_priority(retry_ts, 'data_size')},
+		last_error = {quoted_error}
+	WHERE data_id IN ({ids});
+"""
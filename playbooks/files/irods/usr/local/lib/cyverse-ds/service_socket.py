@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""The Unix domain socket plumbing shared by the Data Store services
+
+Each service listens on a Unix domain socket for requests from the command
+scripts, serving each connection in its own thread. Most services exchange
+JSON objects one per line, replying to a request with the field `op` set to
+`stats` with their event counters and whatever else they report about
+themselves.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+import json
+import logging
+import os
+import signal
+import socketserver
+import threading
+from typing import Any, Dict, Mapping, Optional, Type
+
+
+_LOG = logging.getLogger(__name__)
+
+
+class Counters:
+    """A thread safe set of named event counters"""
+
+    def __init__(self, *names: str):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(names, 0)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increases the named counter"""
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Returns the current value of every counter"""
+        with self._lock:
+            return dict(self._counts)
+
+
+class JSONRequestHandler(socketserver.StreamRequestHandler):
+    """Serves a connection whose requests and replies are JSON objects, one per line
+
+    A stats request receives the server's stats. Any other request is parsed by `parse`, and
+    when it is well formed, performed by `perform`. A malformed request receives a `nack`.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            reply = self._handle_line(line)
+            self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+    def parse(self, fields: Mapping[str, Any]) -> Any:
+        """Extracts a request from the fields of its JSON object
+
+        Raises:
+            ValueError, KeyError, TypeError, AttributeError: the request is malformed
+        """
+        raise NotImplementedError
+
+    def perform(self, request: Any) -> Mapping[str, Any]:
+        """Performs a well formed request, returning the fields of the reply"""
+        raise NotImplementedError
+
+    def _handle_line(self, line: bytes) -> Mapping[str, Any]:
+        try:
+            fields = json.loads(line)
+
+            if fields.get('op') == 'stats':
+                return {'status': 'ack', 'stats': self.server.stats()}  # type: ignore[attr-defined]
+
+            request = self.parse(fields)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return {'status': 'nack', 'error': f"malformed request: {e}"}
+
+        return self.perform(request)
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Serves connections to a Unix domain socket, each in its own thread
+
+    The socket replaces any left behind by an earlier run, and it is writable by the service's
+    group.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        handler: Type[socketserver.BaseRequestHandler],
+        counters: Optional[Counters] = None,
+    ):
+        self.counters = counters
+        _remove_socket(socket_path)
+        super().__init__(socket_path, handler)
+        os.chmod(socket_path, 0o660)
+
+    def stats(self) -> Dict[str, Any]:
+        """Reports the service's counters, extended by services reporting more"""
+        return dict(self.counters.snapshot()) if self.counters else {}
+
+    def serve_until_terminated(self) -> None:
+        """Serves connections until the process receives SIGTERM, then removes the socket"""
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self.shutdown).start())
+        _LOG.info('listening on %s', self.server_address)
+
+        try:
+            self.serve_forever()
+        finally:
+            _remove_socket(str(self.server_address))
+
+
+def _remove_socket(socket_path: str) -> None:
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
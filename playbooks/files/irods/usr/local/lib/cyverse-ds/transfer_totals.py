@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""SQL for recording transfers in the ICAT DB
+
+Transfers are recorded in two tables. r_transfer_totals holds the lifetime
+volume transferred by each user in each direction. Since a volume may exceed
+what a BIGINT can hold, it is split into a count of exbibytes and a count of
+the remaining bytes, which is kept below one exbibyte by carrying into the
+exbibyte count. r_transfer_buckets holds the volume transferred by each user in
+each direction during each UTC hour and each UTC day. It is partitioned by
+month, and the function cyverse_add_transfer_bucket_partitions creates the
+partitions for the current month and a given number of months ahead.
+
+A statement adding volumes may carry a flush ID. The ID is recorded in
+r_transfer_flushes by the same statement, and a statement whose ID has already
+been recorded adds nothing. A caller that can't tell whether a statement
+committed can therefore resend it with the same ID.
+
+© 2026 The Arizona Board of Regents on behalf of The University of
+Arizona. For license information, see https://cyverse.org/license.
+"""
+
+from typing import Mapping, Optional, Tuple
+
+
+EXBIBYTE = 2 ** 60
+
+# the number of months ahead for which r_transfer_buckets partitions are created
+PARTITION_MONTHS_AHEAD = 1
+
+ADD_PARTITIONS = f"SELECT cyverse_add_transfer_bucket_partitions({PARTITION_MONTHS_AHEAD});\n"
+
+# the number of days a flush ID is kept, so a flush resent within that time isn't added twice
+FLUSH_RETENTION_DAYS = 30
+
+PRUNE_FLUSHES = (
+    "DELETE FROM r_transfer_flushes"
+    f" WHERE flush_ts < now() - INTERVAL '{FLUSH_RETENTION_DAYS} days';\n")
+
+_FLUSH_TEMPLATE = """
+	flush AS (
+		INSERT INTO r_transfer_flushes(flush_id) VALUES ('{flush_id}')
+		ON CONFLICT DO NOTHING
+		RETURNING flush_id
+	),"""
+
+_RECORD_SUFFIX = f"""
+	totals AS (
+		INSERT INTO r_transfer_totals(user_id, action, exbibytes, bytes)
+			SELECT user_id, action, exbibytes, bytes FROM deltas
+		ON CONFLICT (user_id, action) DO UPDATE
+			SET
+				exbibytes = r_transfer_totals.exbibytes + EXCLUDED.exbibytes
+					+ (r_transfer_totals.bytes + EXCLUDED.bytes) / {EXBIBYTE},
+				bytes = (r_transfer_totals.bytes + EXCLUDED.bytes) % {EXBIBYTE}
+	)
+INSERT INTO r_transfer_buckets(action, resolution, bucket_start, user_id, bytes)
+	SELECT
+		d.action,
+		r.resolution,
+		date_trunc(r.unit, now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+		d.user_id,
+		CAST(CAST(d.exbibytes AS NUMERIC) * {EXBIBYTE} + d.bytes AS BIGINT)
+	FROM deltas AS d CROSS JOIN (VALUES ('h', 'hour'), ('d', 'day')) AS r(resolution, unit)
+ON CONFLICT (action, resolution, bucket_start, user_id) DO UPDATE
+	SET bytes = r_transfer_buckets.bytes + EXCLUDED.bytes;
+"""
+
+
+def split(volume: int) -> Tuple[int, int]:
+    """Splits a volume into exbibytes and the remaining bytes"""
+    return divmod(volume, EXBIBYTE)
+
+
+def record(sums: Mapping[Tuple[int, str], int], flush_id: Optional[str] = None) -> str:
+    """Generates a single statement adding volumes to both transfer tables
+
+    The rows are generated in key order, so that concurrent statements lock rows in the same
+    order and can't deadlock.
+
+    Args:
+        sums: the volumes to add, keyed by user ID and action. The actions must already have
+            been validated, since they aren't escaped.
+        flush_id: when given, the statement adds nothing if a statement with this ID was
+            already committed. It must be a UUID, since it isn't escaped.
+    """
+    rows = []
+
+    for (user_id, action), volume in sorted(sums.items()):
+        exbibytes, remainder = split(volume)
+        rows.append(
+            f"(CAST({user_id} AS BIGINT), CAST('{action}' AS VARCHAR(250)), "
+            f"CAST({exbibytes} AS BIGINT), CAST({remainder} AS BIGINT))")
+
+    if flush_id is None:
+        flush = ''
+        deltas = 'VALUES ' + ', '.join(rows)
+    else:
+        flush = _FLUSH_TEMPLATE.format(flush_id=flush_id)
+        deltas = (
+            'SELECT * FROM (VALUES ' + ', '.join(rows) + ') AS v'
+            ' WHERE EXISTS (SELECT 1 FROM flush)')
+
+    return (
+        '\nWITH' + flush
+        + '\n\tdeltas(user_id, action, exbibytes, bytes) AS (' + deltas + '),'
+        + _RECORD_SUFFIX)
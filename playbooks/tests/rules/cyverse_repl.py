@@ -4,17 +4,25 @@
 # © 2025 The Arizona Board of Regents on behalf of The University of Arizona.
 # For license information, see https://cyverse.org/license.
 
-"""Tests of cyverse_repl.re rule logic."""
+"""Tests of cyverse_repl.re rule logic and the replication queue it feeds."""
 
+from os import environ, path
+import sys
 import unittest
 
 from irods.exception import SYS_INVALID_RESC_INPUT, SYS_NOT_ALLOWED
 from irods.models import RuleExec
 from irods.path import iRODSPath
+import psycopg2
 
 import test_rules
 from test_rules import IrodsTestCase, IrodsType
 
+sys.path.append(path.join(path.dirname(__file__), '../../files/irods/usr/local/lib/cyverse-ds'))
+
+import replication_queue  # noqa: E402 pylint: disable=wrong-import-position
+from replication_queue import Entry  # noqa: E402 pylint: disable=wrong-import-position
+
 
 def setUpModule():  # pylint: disable=invalid-name
     """Set up main module"""
@@ -106,27 +114,73 @@ class TestAcsetrescschemeforreplDefault(IrodsTestCase):
 class TestDataobjcreated(IrodsTestCase):
     """Tests of cyverse_repl_dataObjCreated"""
 
-    def test(self):
+    _ARGS_FILE = '/tmp/enqueue-replication.args'
+    _FAIL_FLAG = '/tmp/enqueue-replication.fail'
+
+    def setUp(self):
+        super().setUp()
+        self.ensure_obj_absent('/testing/home/rods/obj')
+        self._run_remote(f"rm --force {self._ARGS_FILE} {self._FAIL_FLAG}")
+        self.scp.put(
+            path.join(path.dirname(__file__), 'mocks/enqueue-replication'),
+            '/var/lib/irods/msiExecCmd_bin')
+
+    def tearDown(self):
+        self.scp.put(
+            path.join(
+                path.dirname(__file__),
+                '../../files/irods/var/lib/irods/msiExecCmd_bin/enqueue-replication'),
+            '/var/lib/irods/msiExecCmd_bin')
+        self._run_remote(f"rm --force {self._ARGS_FILE} {self._FAIL_FLAG}")
+        self.ensure_obj_absent('/testing/home/rods/obj')
+        super().tearDown()
+
+    def test_enqueued(self):
         """
-        Verify that a replication rule is scheduled when a data object is
-        created
+        Verify that a replication is queued when a data object is created, and
+        that no replication rule is scheduled
         """
+        scheduled = self._count_scheduled()
         obj = self.irods.data_objects.create('/testing/home/rods/obj')
+        self._exec_created()
+        queued = [a.split() for a in self._run_remote(f"cat {self._ARGS_FILE}").splitlines()]
+        if not queued:
+            self.fail("cyverse_repl_dataObjCreated did not queue the replication")
+        for args in queued:
+            if args[:2] != ['repl', str(obj.id)] or args[3:] != ['replRes']:
+                self.fail(f"cyverse_repl_dataObjCreated queued {args}")
+        if self._count_scheduled() != scheduled:
+            self.fail("cyverse_repl_dataObjCreated scheduled the _repl_replicate rule")
+
+    def test_not_enqueued(self):
+        """
+        Verify that a replication rule is scheduled when a data object is
+        created, and its replication can't be queued
+        """
+        self._run_remote(f"touch {self._FAIL_FLAG}")
+        scheduled = self._count_scheduled()
+        self.irods.data_objects.create('/testing/home/rods/obj')
+        self._exec_created()
+        if self._count_scheduled() <= scheduled:
+            self.fail(
+                "cyverse_repl_dataObjCreated did not schedule the _repl_replicate rule")
+
+    def _count_scheduled(self) -> int:
+        return sum(
+            1 for r in self.irods.query(RuleExec.name)
+            if r[RuleExec.name].find('_repl_replicate') != -1)
+
+    def _exec_created(self) -> None:
         rule = """
             *doi.logical_path = "/testing/home/rods/obj";
             *doi.resc_hier = "ingestRes";
             cyverse_repl_dataObjCreated("rods", "testing", *doi);
         """
         self.exec_rule(self.mk_rule(rule), IrodsType.NONE)
-        ruleFound = False
-        for result in self.irods.query(RuleExec.name):
-            if result[RuleExec.name].find('_repl_replicate') != -1:
-                ruleFound = True
-                break
-        if not ruleFound:
-            self.fail(
-                "cyverse_repl_dataObjCreated did not schedule the _repl_replicate rule")
-        obj.unlink(force=True)
+
+    def _run_remote(self, cmd: str) -> str:
+        _, stdout, _ = self.ssh.exec_command(cmd)
+        return stdout.read().decode('utf-8')
 
 
 class TestPepResourceResolveHierarchyPre(IrodsTestCase):
@@ -182,6 +236,60 @@ class TestPepResourceResolveHierarchyPre(IrodsTestCase):
                 break
 
 
+class TestReplicationQueuePriority(IrodsTestCase):
+    """Tests of the order the replication queue's due entries are claimed in"""
+
+    _SMALL_ID = 1
+    _LARGE_ID = 2
+
+    def setUp(self):
+        super().setUp()
+        self._conn = psycopg2.connect(
+            host=environ.get("PGHOST"),
+            dbname=environ.get("PGDATABASE"),
+            user=environ.get("PGUSER"),
+            password=environ.get("PGPASSWORD"))
+        # The temporary tables shadow the ICAT ones for the rest of the transaction, which is
+        # rolled back, so the tests neither see nor change the real queue.
+        self._conn.cursor().execute(f"""
+            CREATE TEMPORARY TABLE r_replication_queue (LIKE r_replication_queue INCLUDING ALL);
+            CREATE TEMPORARY TABLE r_data_main (data_id BIGINT, data_size BIGINT);
+            INSERT INTO r_data_main VALUES
+                ({self._SMALL_ID}, 1024), ({self._LARGE_ID}, {2 ** 40});
+        """)
+
+    def tearDown(self):
+        self._conn.rollback()
+        self._conn.close()
+        super().tearDown()
+
+    def test_small_first(self):
+        """Verify that a small data object is claimed ahead of a large one queued earlier"""
+        self._enqueue(self._LARGE_ID, -60)
+        self._enqueue(self._SMALL_ID, 0)
+        self.assertEqual(self._claim_next(), self._SMALL_ID)
+        self.assertEqual(self._claim_next(), self._LARGE_ID)
+
+    def test_large_not_starved(self):
+        """
+        Verify that a large data object is claimed ahead of a small one once it
+        has waited longer than the maximum size penalty
+        """
+        self._enqueue(self._LARGE_ID, -replication_queue.MAX_SIZE_PENALTY - 60)
+        self._enqueue(self._SMALL_ID, 0)
+        self.assertEqual(self._claim_next(), self._LARGE_ID)
+        self.assertEqual(self._claim_next(), self._SMALL_ID)
+
+    def _enqueue(self, data_id: int, delay: int) -> None:
+        self._conn.cursor().execute(
+            replication_queue.enqueue([Entry(data_id, 'repl', 'replRes')], delay))
+
+    def _claim_next(self) -> int:
+        cur = self._conn.cursor()
+        cur.execute(replication_queue.claim(1))
+        return cur.fetchone()[0]
+
+
 class TestCyverseRepl(IrodsTestCase):
     """Test cyverse_repl.re"""
 
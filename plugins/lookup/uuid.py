@@ -11,7 +11,7 @@ This lookup plugin generates UUIDs based on the provided type parameter.
 # Import the necessary Ansible libraries
 from __future__ import absolute_import, division, print_function
 
-# Import the UUID standard library
+# Import the standard libraries
 import uuid as impl  # pylint: disable=import-self
 
 # Import base classes from Ansible
@@ -38,13 +38,22 @@ description: >
     - 3: Name-based UUID (UUID3 with MD5 hash)
     - 5: Name-based UUID (UUID5 with SHA1 hash)
 
+  Use query, or lookup with wantlist=True, to receive more than one UUID as a list.
+
 options:
   _terms:
     description: >
       The first element must be the type of UUID to generate (1, 4, 3, or 5). For types 3 and 5, a
-      namespace and name must also be provided as the second and third elements, respectively.
+      namespace and at least one name must also be provided as the second and subsequent elements,
+      respectively. A name may also be a list of names. One UUID is generated per name, in the
+      order the names are given.
     required: True
     type: list
+  count:
+    description: >
+      The number of UUIDs to generate for types 1 and 4, default is 1. Types 3 and 5 generate one
+      UUID per name, so they reject it.
+    type: int
 '''
 
 EXAMPLES = r'''
@@ -60,13 +69,41 @@ EXAMPLES = r'''
 - name: Generate a name-based UUID (UUID3 with MD5 hash)
   ansible.builtin.debug:
     msg: "{{ lookup('uuid', 3, '6ba7b810-9dad-11d1-80b4-00c04fd430c8', 'my_name') }}"
+
+- name: Generate ten random UUIDs (UUID4)
+  ansible.builtin.debug:
+    msg: "{{ query('uuid', 4, count=10) }}"
+
+- name: Generate a name-based UUID (UUID5 with SHA1 hash) for each inventory host
+  ansible.builtin.debug:
+    msg: >-
+      {{ query('uuid', 5, '6ba7b810-9dad-11d1-80b4-00c04fd430c8', groups['all']) }}
 '''
 
 
+def _name_uuid(uuid_type, namespace, name):
+    if uuid_type == 3:
+        return str(impl.uuid3(namespace, name))  # pylint: disable=no-member
+
+    return str(impl.uuid5(namespace, name))  # pylint: disable=no-member
+
+
+def _names(terms):
+    names = []
+
+    for term in terms:
+        if isinstance(term, (list, tuple)):
+            names.extend(str(t) for t in term)
+        else:
+            names.append(str(term))
+
+    return names
+
+
 class LookupModule(LookupBase):
     """ Generate UUIDs based on the provided type parameter """
 
-    def run(self, terms, _variables=None, **_kwargs):
+    def run(self, terms, variables=None, **kwargs):
         """
         Generate UUIDs based on the provided type parameter.
 
@@ -76,10 +113,14 @@ class LookupModule(LookupBase):
         - 3: Name-based UUID (UUID3 with MD5 hash)
         - 5: Name-based UUID (UUID5 with SHA1 hash)
 
-        For name-based UUIDs (types 3 and 5), you must provide a namespace and a name:
-        - 3, namespace, name
-        - 5, namespace, name
+        For types 1 and 4, the count option sets how many UUIDs to generate.
+
+        For name-based UUIDs (types 3 and 5), you must provide a namespace and one or more names,
+        each of which may be a list of names:
+        - 3, namespace, name, ...
+        - 5, namespace, name, ...
         """
+        self.set_options(var_options=variables, direct=kwargs)
 
         # Ensure that at least one term is passed for the UUID type
         if len(terms) == 0:
@@ -89,29 +130,41 @@ class LookupModule(LookupBase):
 
         uuid_type = int(terms[0])
 
-        # Generate UUID based on the provided type using match statement
+        count = self.get_option('count')
+
+        if count is not None and count < 1:
+            raise AnsibleError(f"count must be positive, not {count}")
+
+        # Generate UUIDs based on the provided type using match statement
         match uuid_type:
             case 1:
                 # Time-based UUID (UUID1)
-                return [str(impl.uuid1())]  # pylint: disable=no-member
+                return [str(impl.uuid1()) for _ in range(count or 1)]  # pylint: disable=no-member
 
             case 4:
                 # Random UUID (UUID4)
-                return [str(impl.uuid4())]  # pylint: disable=no-member
+                return [str(impl.uuid4()) for _ in range(count or 1)]  # pylint: disable=no-member
 
-            case 3:
-                # UUID3 (MD5 hash)
-                if len(terms) < 3:
+            case 3 | 5:
+                # UUID3 (MD5 hash) or UUID5 (SHA1 hash)
+                if count is not None:
                     raise AnsibleError(
-                        "You must provide a namespace and a name for a name-based UUID (type 3)")
-                return [str(impl.uuid3(impl.UUID(terms[1]), terms[2]))]  # pylint: disable=no-member
+                        f"count isn't supported for a name-based UUID (type {uuid_type}), one"
+                        " UUID is generated per name")
+
+                names = _names(terms[2:])
 
-            case 5:
-                # UUID5 (SHA1 hash)
-                if len(terms) < 3:
+                if len(terms) < 2 or not names:
                     raise AnsibleError(
-                        "You must provide a namespace and a name for a name-based UUID (type 5)")
-                return [str(impl.uuid5(impl.UUID(terms[1]), terms[2]))]  # pylint: disable=no-member
+                        "You must provide a namespace and a name for a name-based UUID"
+                        f" (type {uuid_type})")
+
+                try:
+                    namespace = impl.UUID(str(terms[1]))
+                except ValueError as e:
+                    raise AnsibleError(f"Invalid namespace UUID '{terms[1]}'") from e
+
+                return [_name_uuid(uuid_type, namespace, n) for n in names]
 
             case _:
                 # If an unsupported UUID type is specified
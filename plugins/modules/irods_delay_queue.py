@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# © 2026 The Arizona Board of Regents on behalf of The University of Arizona.
+# For license information, see https://cyverse.org/license.
+
+"""Provides an ansible module for inspecting and relieving the iRODS delay queue."""
+
+import json
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+DOCUMENTATION = r'''
+---
+module: cyverse.ds.irods_delay_queue
+
+short_description: an ansible module for inspecting and relieving the iRODS delay queue
+
+description: >
+  This module summarizes the rules queued in the iRODS delay queue by rule name and target host, or
+  it cancels or reschedules the queued rules matching a pattern. It runs the delay-queue tool
+  installed in /usr/local/lib/cyverse-ds on a catalog service provider, so it needs to be run there
+  as the iRODS service account.
+
+version_added: "2.16.14"
+
+author: CyVerse Data Store Team
+
+options:
+  operation:
+    description: >
+      what to do. `summary` reports the queued rules by rule name and target host. `cancel`
+      removes the queued rules whose text matches `rule` with iqdel. If iqdel fails, the rules it
+      already removed stay removed. `reschedule` sets the execution time of the queued rules whose
+      text matches `rule` to `delay` seconds from now, spread at random over `spread` more
+      seconds, in a single transaction.
+    type: str
+    choices:
+      - cancel
+      - reschedule
+      - summary
+    required: false
+    default: summary
+  rule:
+    description: >
+      the POSIX regular expression the text of the rules to cancel or reschedule must match. It is
+      required when `operation` is `cancel` or `reschedule`.
+    type: str
+    required: false
+  host:
+    description: only cancel or reschedule the rules executed on this host
+    type: str
+    required: false
+  delay:
+    description: the number of seconds from now the rules are rescheduled to
+    type: int
+    required: false
+    default: 0
+  spread:
+    description: the number of seconds the rescheduled rules are spread over after the delay
+    type: int
+    required: false
+    default: 0
+  config:
+    description: the file providing the ICAT DB connection settings
+    type: str
+    required: false
+    default: /etc/irods/icat.conf
+'''
+
+EXAMPLES = r'''
+- name: Postpone the pending replications to rs-1 over the next hour
+  cyverse.ds.irods_delay_queue:
+    operation: reschedule
+    rule: ^\s*_repl_
+    host: rs-1.example.org
+    delay: 600
+    spread: 3600
+'''
+
+RETURN = r'''
+---
+summary:
+  description: >
+    the queued rules grouped by rule name and target host. Each group has the `rule`, the `host`,
+    the `count` of queued rules, how many are `due`, how many have been `attempted`, the
+    `oldest_age` and `max_lateness` in seconds, and the counts `by_age`.
+  type: list
+  returned: when operation is summary
+rules:
+  description: the number of cancelled or rescheduled rules by rule name
+  type: dict
+  returned: when operation is cancel or reschedule
+'''
+
+_DELAY_QUEUE = '/usr/local/lib/cyverse-ds/delay-queue'
+
+_ARG_SPEC = {
+    'operation': {
+        'type': 'str',
+        'choices': ['cancel', 'reschedule', 'summary'],
+        'default': 'summary',
+    },
+    'rule': {
+        'type': 'str',
+    },
+    'host': {
+        'type': 'str',
+    },
+    'delay': {
+        'type': 'int',
+        'default': 0,
+    },
+    'spread': {
+        'type': 'int',
+        'default': 0,
+    },
+    'config': {
+        'type': 'str',
+        'default': '/etc/irods/icat.conf',
+    },
+}
+
+
+def _command(params, check_mode):
+    cmd = [_DELAY_QUEUE, '--config', params['config'], '--json', params['operation']]
+
+    if params['operation'] != 'summary':
+        cmd.extend(['--rule', params['rule']])
+
+        if params['host']:
+            cmd.extend(['--host', params['host']])
+
+        if params['operation'] == 'reschedule':
+            cmd.extend(['--delay', str(params['delay']), '--spread', str(params['spread'])])
+
+        if check_mode:
+            cmd.append('--dry-run')
+
+    return cmd
+
+
+def main() -> None:
+    """This is the entrypoint."""
+    module = AnsibleModule(
+        argument_spec=_ARG_SPEC,
+        required_if=[
+            ('operation', 'cancel', ['rule']),
+            ('operation', 'reschedule', ['rule']),
+        ],
+        supports_check_mode=True)
+
+    params = module.params
+    rc, stdout, stderr = module.run_command(_command(params, module.check_mode))
+
+    if rc != 0:
+        module.fail_json(msg=stderr.strip() or 'delay-queue failed', params=params)
+
+    result = json.loads(stdout)
+
+    if params['operation'] == 'summary':
+        module.exit_json(changed=False, summary=result)
+    else:
+        module.exit_json(changed=result['changed'] > 0, rules=result['rules'])
+
+
+if __name__ == '__main__':
+    main()
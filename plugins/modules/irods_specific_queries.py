@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# © 2026 The Arizona Board of Regents on behalf of The University of Arizona.
+# For license information, see https://cyverse.org/license.
+
+"""Provides an ansible module for synchronizing the iRODS specific queries."""
+
+import hashlib
+import os
+import ssl
+from typing import Dict, List, Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+DOCUMENTATION = r'''
+---
+module: cyverse.ds.irods_specific_queries
+
+short_description: an ansible module for synchronizing the iRODS specific queries
+
+description: >
+  This module makes the specific queries registered in an iRODS zone match a set of desired
+  queries. It lists the registered queries once, compares them to the desired ones by alias and by
+  the SHA-256 hash of their SQL, and then only adds the missing queries, replaces the ones whose SQL
+  differs, and removes the ones listed in `remove`, all over a single session. A query registered
+  by anything else is never removed unless it is listed. iRODS can neither change the SQL of a
+  registered query nor rename one, so a replaced query is removed and then immediately registered
+  again with its new SQL. It is missing for the time between the two requests. If the new SQL
+  can't be registered, the old SQL is registered again.
+
+version_added: "2.16.14"
+
+author: CyVerse Data Store Team
+
+options:
+  path:
+    description: >
+      a directory holding desired queries, one per file. A file named ALIAS.sql holds the SQL of
+      the query ALIAS.
+    type: path
+    required: false
+  queries:
+    description: >
+      desired queries as a mapping from alias to SQL. They take precedence over the queries in
+      `path` with the same aliases.
+    type: dict
+    required: false
+    default: {}
+  remove:
+    description: >
+      the aliases of the queries to remove when they are registered, e.g., queries that have been
+      retired. An alias can't be both desired and removed.
+    type: list
+    elements: str
+    required: false
+    default: []
+  host:
+    description: the FQDN or IP address of the iRODS server to connect to
+    type: str
+    required: false
+    default: localhost.localdomain
+  port:
+    description: the TCP port to connect to
+    type: int
+    required: false
+    default: 1247
+  zone:
+    description: the local zone served by iRODS
+    type: str
+    required: true
+  username:
+    description: the rodsadmin account used when connecting
+    type: str
+    required: false
+    default: rods
+  password:
+    description: the password used to authenticate the account
+    type: str
+    required: true
+
+requirements:
+  - python-irodsclient>=0.8.2
+'''
+
+EXAMPLES = r'''
+- name: Install specific queries
+  delegate_to: localhost
+  become: false
+  cyverse.ds.irods_specific_queries:
+    path: files/irods/specific-queries
+    queries:
+      IPCCountUsers: SELECT COUNT(*) FROM r_user_main
+    remove:
+      - IPCCountGroups
+    host: ies.example.org
+    zone: tempZone
+    password: rods
+'''
+
+RETURN = r'''
+---
+added:
+  description: the aliases of the queries that were registered
+  type: list
+  returned: always
+replaced:
+  description: the aliases of the queries whose SQL was replaced
+  type: list
+  returned: always
+removed:
+  description: the aliases of the queries that were removed
+  type: list
+  returned: always
+'''
+
+_IRODSCLIENT_PACK_ERR: Optional[Exception] = None
+
+try:
+    from irods.column import Column, String
+    from irods.exception import iRODSException
+    from irods.query import SpecificQuery
+    from irods.session import iRODSSession
+
+    # the columns of the built-in ls query, which lists the registered queries
+    _ALIAS = Column(String, 'SPECIFIC_QUERY_ALIAS', 0)
+    _SQL = Column(String, 'SPECIFIC_QUERY_SQL', 1)
+
+except Exception as import_error:  # pylint: disable=broad-except
+    _IRODSCLIENT_PACK_ERR = import_error
+
+_ARG_SPEC = {
+    'path': {
+        'type': 'path',
+    },
+    'queries': {
+        'type': 'dict',
+        'default': {},
+    },
+    'remove': {
+        'type': 'list',
+        'elements': 'str',
+        'default': [],
+    },
+    'host': {
+        'type': 'str',
+        'default': 'localhost.localdomain',
+    },
+    'port': {
+        'type': 'int',
+        'default': 1247,
+    },
+    'zone': {
+        'type': 'str',
+        'required': True,
+    },
+    'username': {
+        'type': 'str',
+        'default': 'rods',
+    },
+    'password': {
+        'type': 'str',
+        'required': True,
+        'no_log': True,
+    },
+}
+
+
+def _digest(sql: str) -> str:
+    return hashlib.sha256(sql.strip().encode('utf-8')).hexdigest()
+
+
+def _desired_queries(path: Optional[str], queries: Dict[str, str]) -> Dict[str, str]:
+    desired = {}
+
+    if path:
+        for name in sorted(os.listdir(path)):
+            alias, ext = os.path.splitext(name)
+
+            if ext == '.sql':
+                with open(os.path.join(path, name), encoding='utf-8') as f:
+                    desired[alias] = f.read().strip()
+
+    desired.update({alias: str(sql).strip() for alias, sql in queries.items()})
+    return desired
+
+
+def _registered_queries(session: 'iRODSSession') -> Dict[str, str]:
+    query = SpecificQuery(session, alias='ls', columns=[_ALIAS, _SQL])
+    return {r[_ALIAS]: r[_SQL] for r in query}
+
+
+def _diff(
+    registered: Dict[str, str], desired: Dict[str, str], remove: List[str]
+) -> Dict[str, List[str]]:
+    registered_digests = {a: _digest(q) for a, q in registered.items()}
+    desired_digests = {a: _digest(q) for a, q in desired.items()}
+    return {
+        'added': sorted(a for a in desired_digests if a not in registered_digests),
+        'replaced': sorted(
+            a for a, d in desired_digests.items()
+            if a in registered_digests and registered_digests[a] != d),
+        'removed': sorted(a for a in set(remove) if a in registered_digests),
+    }
+
+
+def _replace(session: 'iRODSSession', alias: str, old_sql: str, new_sql: str) -> None:
+    SpecificQuery(session, alias=alias).remove()
+
+    try:
+        SpecificQuery(session, new_sql, alias).register()
+    except iRODSException:
+        SpecificQuery(session, old_sql, alias).register()
+        raise
+
+
+def _apply(
+    session: 'iRODSSession',
+    registered: Dict[str, str],
+    desired: Dict[str, str],
+    diff: Dict[str, List[str]],
+) -> None:
+    for alias in diff['removed']:
+        SpecificQuery(session, alias=alias).remove()
+
+    for alias in diff['replaced']:
+        _replace(session, alias, registered[alias], desired[alias])
+
+    for alias in diff['added']:
+        SpecificQuery(session, desired[alias], alias).register()
+
+
+def main() -> None:
+    """This is the entrypoint."""
+    module = AnsibleModule(argument_spec=_ARG_SPEC, supports_check_mode=True)
+
+    if _IRODSCLIENT_PACK_ERR:
+        module.fail_json(msg=f"python-irodsclient issue: {_IRODSCLIENT_PACK_ERR}")
+
+    params = module.params
+
+    try:
+        desired = _desired_queries(params['path'], params['queries'])
+    except OSError as e:
+        module.fail_json(msg=f"failed to read the queries: {e}")
+
+    conflicts = sorted(set(params['remove']) & set(desired))
+
+    if conflicts:
+        module.fail_json(msg=f"queries both desired and removed: {', '.join(conflicts)}")
+
+    try:
+        with iRODSSession(
+            host=params['host'],
+            port=params['port'],
+            zone=params['zone'],
+            user=params['username'],
+            password=params['password'],
+            ssl_context=ssl.create_default_context(ssl.Purpose.SERVER_AUTH),
+        ) as session:
+            registered = _registered_queries(session)
+            diff = _diff(registered, desired, params['remove'])
+
+            if not module.check_mode:
+                _apply(session, registered, desired, diff)
+    except iRODSException as e:
+        module.fail_json(msg=f"failed to synchronize the specific queries: {e!r}")
+
+    module.exit_json(changed=any(diff.values()), **diff)
+
+
+if __name__ == '__main__':
+    main()